@@ -0,0 +1,102 @@
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator
+
+from library_manager import LibraryManager
+from storage import Storage
+
+CSV_FIELDS = ["id", "title", "author", "year", "status"]
+
+
+@dataclass
+class BulkReport:
+    count: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.count / self.seconds if self.seconds else float(self.count)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.count} записей за {self.seconds:.2f} с "
+            f"({self.records_per_second:.0f} записей/с)"
+        )
+
+
+def detect_format(path: str) -> str:
+    """
+    Определяет формат файла импорта или экспорта по расширению.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Неподдерживаемый формат файла '{path}': ожидается .csv или .jsonl")
+
+
+def read_records(path: str) -> Iterator[dict]:
+    """
+    Потоково читает записи книг из файла CSV или JSON Lines.
+    """
+    with open(path, mode="r", encoding="UTF-8", newline="") as file:
+        if detect_format(path) == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def import_books(
+    library_manager: LibraryManager, path: str, batch_size: int = 10_000
+) -> BulkReport:
+    """
+    Импортирует книги из файла пачками по batch_size записей.
+    """
+    started = time.perf_counter()
+    count = library_manager.add_books_bulk(read_records(path), batch_size)
+    return BulkReport(count, time.perf_counter() - started)
+
+
+def export_books(
+    library_manager: LibraryManager, path: str, batch_size: int = 10_000
+) -> BulkReport:
+    """
+    Экспортирует каталог в файл CSV или JSON Lines пачками по batch_size книг.
+    """
+    file_format = detect_format(path)
+    started = time.perf_counter()
+    books = library_manager.iter_books()
+    count = 0
+    with open(path, mode="w", encoding="UTF-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        if file_format == "csv":
+            writer.writeheader()
+        while page := list(islice(books, batch_size)):
+            if file_format == "csv":
+                writer.writerows(page)
+            else:
+                file.writelines(
+                    json.dumps(book, ensure_ascii=False) + "\n" for book in page
+                )
+            count += len(page)
+    return BulkReport(count, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in ("import", "export"):
+        print("Использование: python src/bulk.py import|export <файл.csv|файл.jsonl>")
+        sys.exit(1)
+    library_manager = LibraryManager(Storage("books.json"))
+    if sys.argv[1] == "import":
+        report = import_books(library_manager, sys.argv[2])
+    else:
+        report = export_books(library_manager, sys.argv[2])
+    print(report)
@@ -0,0 +1,95 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+
+class NGramIndex:
+    def __init__(self, n: int = 3):
+        """
+        Инвертированный индекс n-грамм по названию и автору книги
+        в нижнем регистре и точный индекс по году издания.
+
+        Индекс только сужает набор кандидатов: книга, содержащая строку
+        запроса, обязательно содержит все её n-граммы, но обратное неверно,
+        поэтому кандидатов нужно проверить подстрокой.
+        """
+        self.n = n
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+        self._years: defaultdict[str, set[int]] = defaultdict(set)
+        self._order: dict[int, int] = {}
+        self._next_position = 0
+
+    def build(self, books: Iterable[dict]) -> None:
+        """
+        Строит индекс по книгам в порядке каталога.
+        """
+        for book in books:
+            self.add(book)
+
+    def add(self, book: dict) -> None:
+        """
+        Добавляет книгу в конец индекса.
+        """
+        book_id = book["id"]
+        for gram in self._book_grams(book):
+            self._postings[gram].add(book_id)
+        self._years[str(book["year"])].add(book_id)
+        self._order[book_id] = self._next_position
+        self._next_position += 1
+
+    def remove(self, book: dict) -> None:
+        """
+        Удаляет книгу из индекса.
+        """
+        book_id = book["id"]
+        for gram in self._book_grams(book):
+            posting = self._postings[gram]
+            posting.discard(book_id)
+            if not posting:
+                del self._postings[gram]
+        year = str(book["year"])
+        self._years[year].discard(book_id)
+        if not self._years[year]:
+            del self._years[year]
+        del self._order[book_id]
+
+    def candidates(self, value: str) -> Optional[set[int]]:
+        """
+        Возвращает ID книг, в названии или авторе которых может быть value.
+        Если запрос короче n символов, индекс не помогает и возвращается None.
+        """
+        if len(value) < self.n:
+            return None
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in self._grams(value)), key=len
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    def year_matches(self, value: str) -> set[int]:
+        """
+        Возвращает ID книг, год издания которых совпадает с value.
+        """
+        return self._years.get(value, set())
+
+    def in_catalog_order(self, book_ids: Iterable[int]) -> list[int]:
+        """
+        Упорядочивает ID книг в порядке каталога.
+        """
+        return sorted(book_ids, key=self._order.__getitem__)
+
+    def _book_grams(self, book: dict) -> set[str]:
+        """
+        Возвращает n-граммы названия и автора книги.
+        """
+        return self._grams(book["title"].lower()) | self._grams(book["author"].lower())
+
+    def _grams(self, text: str) -> set[str]:
+        """
+        Возвращает все n-граммы строки.
+        """
+        return {text[i : i + self.n] for i in range(len(text) - self.n + 1)}
@@ -9,7 +9,7 @@ try:
 except ImportError:
     CURSES_AVAILABLE = False
 
-from typing import Optional
+from typing import Callable, Optional
 from library_manager import LibraryManager
 
 
@@ -28,6 +28,7 @@ class BaseInterface(ABC):
         "5. Изменить статус книги",
         "6. Выйти",
     ]
+    BOOKS_PER_PAGE = 5
 
     def __init__(self, lib_manager):
         self.lib_manager = lib_manager
@@ -82,12 +83,31 @@ class BaseInterface(ABC):
         pass
 
     @abstractmethod
-    def _show_books_with_pagination(self, books: list[dict]):
+    def _show_books_with_pagination(
+        self, fetch_page: Callable[[int, int], list[dict]]
+    ):
         """
         Унифицированный метод для отображения книг с пагинацией.
+        Страницы запрашиваются через fetch_page(offset, limit) по мере листания.
         """
         pass
 
+    def _fetch_all_books_page(self, offset: int, limit: int) -> list[dict]:
+        """
+        Возвращает страницу списка всех книг.
+        """
+        return list(self.lib_manager.iter_books(offset, limit))
+
+    def _fetch_page(
+        self, fetch_page: Callable[[int, int], list[dict]], page: int
+    ) -> tuple[list[dict], bool]:
+        """
+        Возвращает книги страницы и признак наличия следующей страницы.
+        """
+        # Запрашиваем на одну книгу больше, чтобы узнать, есть ли следующая страница.
+        books = fetch_page(page * self.BOOKS_PER_PAGE, self.BOOKS_PER_PAGE + 1)
+        return books[: self.BOOKS_PER_PAGE], len(books) > self.BOOKS_PER_PAGE
+
     @abstractmethod
     def _get_user_input(self, prompt: str) -> str:
         """
@@ -185,31 +205,30 @@ class InterfacePython(BaseInterface):
                 return "Изменение статуса отменено"
 
     def show_all_books(self):
-        self._show_books_with_pagination(self.lib_manager.get_all_books())
+        self._show_books_with_pagination(self._fetch_all_books_page)
 
     def show_books_search(self):
         query = self._get_user_input("Введите строку для поиска:\n")
-        books = self.lib_manager.search_books_by_value(query)
-        self._show_books_with_pagination(books)
+        cursor = self.lib_manager.search_cursor(query)
+        self._show_books_with_pagination(cursor.fetch)
 
-    def _show_books_with_pagination(self, books: list[dict]):
+    def _show_books_with_pagination(
+        self, fetch_page: Callable[[int, int], list[dict]]
+    ):
         """
         Унифицированный метод для отображения книг с пагинацией.
         """
-        total_books = len(books)
-        books_per_page = 5
         current_page = 0
-        total_pages = (total_books - 1) // books_per_page + 1
 
         while True:
+            books, has_next_page = self._fetch_page(fetch_page, current_page)
             self._clear_screen()
-            self._add_text(
-                f"Книги: страница {current_page + bool(total_books)} из {total_pages}\n"
-            )
+            if books:
+                self._add_text(f"Книги: страница {current_page + 1}\n")
+            else:
+                self._add_text("Книги не найдены\n")
 
-            start = current_page * books_per_page
-            end = min(start + books_per_page, total_books)
-            for idx, book in enumerate(books[start:end], start=2):
+            for book in books:
                 self._add_text(
                     f"ID: {book['id']}, Название: {book['title']}, Автор: {book['author']}, "
                     f"Год: {book['year']}, Статус: {book['status']}",
@@ -220,7 +239,7 @@ class InterfacePython(BaseInterface):
             self._add_text("3. Вернуться в главное меню")
 
             key = self.get_value()
-            if key == "1" and current_page < total_pages - 1:
+            if key == "1" and has_next_page:
                 current_page += 1
             elif key == "2" and current_page > 0:
                 current_page -= 1
@@ -334,12 +353,12 @@ if CURSES_AVAILABLE:
                     return StatusMessageCurses("Изменение статуса отменено", 1)
 
         def show_all_books(self):
-            self._show_books_with_pagination(self.lib_manager.get_all_books())
+            self._show_books_with_pagination(self._fetch_all_books_page)
 
         def show_books_search(self):
             query = self._get_user_input("Введите строку для поиска:\n")
-            books = self.lib_manager.search_books_by_value(query)
-            self._show_books_with_pagination(books)
+            cursor = self.lib_manager.search_cursor(query)
+            self._show_books_with_pagination(cursor.fetch)
 
         def _clear_screen(self):
             self.stdscr.clear()
@@ -357,23 +376,20 @@ if CURSES_AVAILABLE:
             curses.noecho()
             return user_input
 
-        def _show_books_with_pagination(self, books: list[dict]):
-            total_books = len(books)
-            books_per_page = 5
+        def _show_books_with_pagination(
+            self, fetch_page: Callable[[int, int], list[dict]]
+        ):
             current_page = 0
-            total_pages = (total_books - 1) // books_per_page + 1
 
             while True:
+                books, has_next_page = self._fetch_page(fetch_page, current_page)
                 self._clear_screen()
-                self._add_text(
-                    0,
-                    0,
-                    f"Книги: страница {current_page + bool(total_books)} из {total_pages}",
-                )
+                if books:
+                    self._add_text(0, 0, f"Книги: страница {current_page + 1}")
+                else:
+                    self._add_text(0, 0, "Книги не найдены")
 
-                start = current_page * books_per_page
-                end = min(start + books_per_page, total_books)
-                for idx, book in enumerate(books[start:end], start=2):
+                for idx, book in enumerate(books, start=2):
                     self._add_text(
                         idx,
                         0,
@@ -386,7 +402,7 @@ if CURSES_AVAILABLE:
                 self._add_text(10, 0, "3. Вернуться в главное меню")
 
                 key = self.get_value()
-                if key == "1" and current_page < total_pages - 1:
+                if key == "1" and has_next_page:
                     current_page += 1
                 elif key == "2" and current_page > 0:
                     current_page -= 1
@@ -0,0 +1,218 @@
+import json
+import os
+import threading
+from itertools import islice
+from typing import Iterator, Optional
+
+from storage import Storage
+
+
+class JournalStorage(Storage):
+    def __init__(
+        self,
+        data_file: str,
+        journal_file: Optional[str] = None,
+        compact_threshold: int = 1024 * 1024,
+    ):
+        """
+        Хранилище со снимком каталога и журналом изменений.
+
+        Каждое изменение (add, delete, set_status) дописывается в журнал
+        одной строкой JSON, поэтому запись не зависит от размера каталога.
+        При загрузке журнал накладывается на последний снимок. Когда журнал
+        превышает compact_threshold байт, в фоновом потоке собирается
+        новый снимок, а журнал очищается.
+        """
+        super().__init__(data_file)
+        self.journal_file = journal_file or f"{data_file}.journal"
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._compaction: Optional[threading.Thread] = None
+
+    def get_signature(self) -> Optional[tuple]:
+        """
+        Возвращает отпечаток снимка и журнала.
+        """
+        return (
+            self._file_signature(self.data_file),
+            self._file_signature(self.journal_file),
+        )
+
+    def load_data(self) -> list[Optional[dict]]:
+        """
+        Загружает снимок и применяет к нему записи журнала.
+        """
+        with self._lock:
+            books, next_id = self._read_file(self.data_file)
+            records = self._read_journal(0)[0]
+        books, self._next_id = self._replay(books, records, next_id)
+        return books
+
+    def iter_data(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Читает снимок потоково и применяет к каждой книге изменения из журнала.
+        """
+        stop = None if limit is None else offset + limit
+        return islice(self._iter_replayed(), offset, stop)
+
+    def save_data(self, data: list[Optional[dict]]) -> None:
+        """
+        Перезаписывает снимок целиком и очищает журнал.
+        """
+        with self._lock:
+            self._generation += 1
+            super().save_data(data)
+            self._write_journal([])
+
+    def apply_changes(self, changes: list[dict]) -> None:
+        """
+        Дописывает изменения в журнал и при необходимости запускает сжатие.
+        """
+        lines = "".join(
+            json.dumps(change, ensure_ascii=False) + "\n" for change in changes
+        )
+        with self._lock:
+            try:
+                with open(self.journal_file, mode="a", encoding="UTF-8") as file:
+                    file.write(lines)
+                    journal_size = file.tell()
+            except IOError as e:
+                raise RuntimeError(
+                    f"Ошибка при записи в журнал '{self.journal_file}': {e}"
+                )
+
+        if journal_size >= self.compact_threshold:
+            self._start_compaction()
+
+    def compact(self) -> None:
+        """
+        Собирает новый снимок из текущего снимка и журнала.
+
+        Записи, добавленные в журнал во время сжатия, сохраняются.
+        """
+        with self._lock:
+            generation = self._generation
+            books, next_id = self._read_file(self.data_file)
+            records, offset = self._read_journal(0)
+
+        books, next_id = self._replay(books, records, next_id)
+        tmp_file = f"{self.data_file}.compact"
+        self._write_file(tmp_file, books, next_id)
+
+        with self._lock:
+            if generation != self._generation:
+                os.remove(tmp_file)
+                return
+            tail = self._read_journal(offset)[0]
+            os.replace(tmp_file, self.data_file)
+            self._write_journal(tail)
+
+    def wait_for_compaction(self) -> None:
+        """
+        Ожидает завершения фонового сжатия, если оно запущено.
+        """
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+
+    def _start_compaction(self) -> None:
+        """
+        Запускает сжатие в фоновом потоке, если оно ещё не идёт.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        self._compaction = threading.Thread(target=self.compact, daemon=True)
+        self._compaction.start()
+
+    def _iter_replayed(self) -> Iterator[dict]:
+        """
+        Выдаёт книги снимка с учётом журнала, затем книги, добавленные в журнал.
+        """
+        with self._lock:
+            records = self._read_journal(0)[0]
+
+        added: dict[int, dict] = {}
+        deleted: set[int] = set()
+        statuses: dict[int, str] = {}
+        for record in records:
+            match record["op"]:
+                case "add":
+                    added[record["book"]["id"]] = dict(record["book"])
+                    deleted.discard(record["book"]["id"])
+                case "delete":
+                    added.pop(record["id"], None)
+                    deleted.add(record["id"])
+                case "set_status":
+                    if record["id"] in added:
+                        added[record["id"]]["status"] = record["status"]
+                    else:
+                        statuses[record["id"]] = record["status"]
+
+        for book in self._iter_file(self.data_file):
+            book_id = book["id"]
+            if book_id in added:
+                yield added.pop(book_id)
+            elif book_id not in deleted:
+                if book_id in statuses:
+                    book["status"] = statuses[book_id]
+                yield book
+        yield from added.values()
+
+    def _read_journal(self, offset: int) -> tuple[list[dict], int]:
+        """
+        Читает записи журнала начиная с offset байт.
+        Возвращает записи и позицию конца прочитанных данных.
+        """
+        if not os.path.exists(self.journal_file):
+            return [], offset
+
+        try:
+            with open(self.journal_file, mode="rb") as file:
+                file.seek(offset)
+                content = file.read()
+        except IOError as e:
+            raise RuntimeError(
+                f"Ошибка при чтении журнала '{self.journal_file}': {e}"
+            )
+
+        # Недописанная последняя строка (сбой во время записи) отбрасывается.
+        complete = content[: content.rfind(b"\n") + 1]
+        records = [
+            json.loads(line) for line in complete.decode("UTF-8").splitlines() if line
+        ]
+        return records, offset + len(complete)
+
+    def _write_journal(self, records: list[dict]) -> None:
+        """
+        Атомарно заменяет журнал переданными записями.
+        """
+        tmp_file = f"{self.journal_file}.tmp"
+        with open(tmp_file, mode="w", encoding="UTF-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_file, self.journal_file)
+
+    @staticmethod
+    def _replay(
+        books: list[dict], records: list[dict], next_id: int
+    ) -> tuple[list[dict], int]:
+        """
+        Применяет записи журнала к списку книг.
+        Возвращает книги и следующий свободный ID с учётом добавленных книг.
+
+        Повторное применение записи не меняет результат, поэтому журнал,
+        уже вошедший в снимок, можно безопасно проиграть ещё раз.
+        """
+        catalog = {book["id"]: book for book in books}
+        for record in records:
+            match record["op"]:
+                case "add":
+                    catalog[record["book"]["id"]] = record["book"]
+                    next_id = max(next_id, record["book"]["id"] + 1)
+                case "delete":
+                    catalog.pop(record["id"], None)
+                case "set_status":
+                    if record["id"] in catalog:
+                        catalog[record["id"]]["status"] = record["status"]
+        return list(catalog.values()), next_id
@@ -1,12 +1,86 @@
-from storage import Storage
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from indexes import NGramIndex
+from storage import BaseStorage
+
+
+class BookCursor:
+    def __init__(self, books: Iterator[dict]):
+        """
+        Постраничный доступ к ленивой последовательности книг.
+
+        Книги читаются из источника только по мере запроса страниц,
+        уже прочитанные сохраняются для возврата к предыдущим страницам.
+        """
+        self._books = books
+        self._fetched: list[dict] = []
+        self.exhausted = False
+
+    def fetch(self, offset: int, limit: int) -> list[dict]:
+        """
+        Возвращает не более limit книг начиная с позиции offset.
+        """
+        missing = offset + limit - len(self._fetched)
+        if missing > 0 and not self.exhausted:
+            chunk = list(islice(self._books, missing))
+            self._fetched.extend(chunk)
+            self.exhausted = len(chunk) < missing
+        return self._fetched[offset : offset + limit]
 
 
 class LibraryManager:
-    def __init__(self, storage: Storage):
+    def __init__(self, storage: BaseStorage):
         """
         Класс для управления библиотекой книг.
+
+        Каталог держится в памяти и перечитывается из хранилища только
+        при изменении файла данных (mtime, размер или inode). Книги хранятся
+        в словаре ID -> запись, сохраняющем порядок каталога, поэтому
+        поиск, изменение и удаление по ID выполняются за O(1).
+
+        Если хранилище само выполняет запросы (supports_queries), каталог
+        в память не загружается и все операции передаются хранилищу.
         """
         self.storage = storage
+        self._pushdown = getattr(storage, "supports_queries", False)
+        self._books: dict[int, dict] = {}
+        self._search_index: Optional[NGramIndex] = None
+        self._signature: Optional[tuple] = None
+        self._loaded = False
+        self._pending_changes: Optional[list[dict]] = None
+
+    @contextmanager
+    def batch(self) -> Iterator["LibraryManager"]:
+        """
+        Объединяет изменения внутри блока with в одну запись в хранилище.
+
+        Каталог загружается один раз при входе, изменения применяются
+        в памяти и сохраняются при выходе. При исключении изменения
+        отбрасываются, а каталог будет перечитан из хранилища.
+        """
+        if self._pending_changes is not None:
+            yield self
+            return
+
+        if self._pushdown:
+            with self.storage.transaction():
+                yield self
+            return
+
+        self._ensure_loaded()
+        self._pending_changes = []
+        try:
+            yield self
+        except BaseException:
+            self._loaded = False
+            raise
+        finally:
+            changes, self._pending_changes = self._pending_changes, None
+
+        if changes:
+            self._commit(*changes)
 
     def add_book(self, title: str, author: str, year: str) -> None:
         """
@@ -15,23 +89,77 @@ class LibraryManager:
         if not year.isdigit():
             raise ValueError("Год должен быть числом.")
 
-        books = self.get_all_books()
         new_book = {
-            "id": self._generate_id(),
             "title": title.strip(),
             "author": author.strip(),
             "year": int(year),
             "status": "в наличии",
         }
-        books.append(new_book)
-        self.storage.save_data(books)
+        if self._pushdown:
+            self.storage.insert_book(new_book)
+            return
+
+        self._ensure_loaded()
+        new_book = {"id": self._allocate_ids(1), **new_book}
+        self._books[new_book["id"]] = new_book
+        if self._search_index is not None:
+            self._search_index.add(new_book)
+        self._commit({"op": "add", "book": new_book})
+
+    def add_books_bulk(self, records: Iterable[dict], batch_size: int = 10_000) -> int:
+        """
+        Добавляет книги пачками и возвращает количество добавленных книг.
+
+        Записи читаются из records по batch_size штук. Для каждой пачки
+        проверяются годы, выделяется непрерывный диапазон ID и выполняется
+        одна запись в хранилище. Если в пачке есть некорректная запись,
+        пачка не сохраняется, а предыдущие пачки остаются в каталоге.
+        """
+        records = iter(records)
+        added = 0
+        while batch := list(islice(records, batch_size)):
+            new_books = []
+            for position, record in enumerate(batch, start=added + 1):
+                year = str(record["year"]).strip()
+                if not year.isdigit():
+                    raise ValueError(
+                        f"Запись {position}: год должен быть числом, получено {year!r}."
+                    )
+                new_books.append(
+                    {
+                        "title": record["title"].strip(),
+                        "author": record["author"].strip(),
+                        "year": int(year),
+                        "status": record.get("status") or "в наличии",
+                    }
+                )
+
+            if self._pushdown:
+                self.storage.insert_books(new_books)
+            else:
+                self._ensure_loaded()
+                first_id = self._allocate_ids(len(new_books))
+                new_books = [
+                    {"id": book_id, **book}
+                    for book_id, book in enumerate(new_books, start=first_id)
+                ]
+                for book in new_books:
+                    self._books[book["id"]] = book
+                    if self._search_index is not None:
+                        self._search_index.add(book)
+                self._commit(*({"op": "add", "book": book} for book in new_books))
+            added += len(new_books)
+        return added
 
     def get_book_by_id(self, book_id: int) -> dict:
         """
         Получает книгу по её ID.
         """
-        books = self.get_all_books()
-        book = next((b for b in books if b["id"] == book_id), None)
+        if self._pushdown:
+            book = self.storage.get_book(book_id)
+        else:
+            self._ensure_loaded()
+            book = self._books.get(book_id)
         if book is None:
             raise KeyError(f"Книга с ID {book_id} не найдена.")
         return book
@@ -40,54 +168,160 @@ class LibraryManager:
         """
         Обновляет статус книги по её ID.
         """
+        if self._pushdown:
+            if not self.storage.update_status(book_id, new_status):
+                raise KeyError(f"Книга с ID {book_id} не найдена.")
+            return
+
         book = self.get_book_by_id(book_id)
         book["status"] = new_status
-        self._save_books_with_update(book)
+        self._commit({"op": "set_status", "id": book_id, "status": new_status})
 
     def delete_book_by_id(self, book_id: int) -> None:
         """
         Удаляет книгу по её ID.
         """
-        books = self.get_all_books()
-        new_books = [book for book in books if book["id"] != book_id]
-        if len(new_books) == len(books):
+        if self._pushdown:
+            if not self.storage.delete_book(book_id):
+                raise KeyError(f"Книга с ID {book_id} не найдена.")
+            return
+
+        self._ensure_loaded()
+        book = self._books.pop(book_id, None)
+        if book is None:
             raise KeyError(f"Книга с ID {book_id} не найдена.")
-        self.storage.save_data(new_books)
+        if self._search_index is not None:
+            self._search_index.remove(book)
+        self._commit({"op": "delete", "id": book_id})
 
     def search_books_by_value(self, value: str) -> list[dict]:
         """
         Ищет книги по значению в названии, авторе или году издания.
+
+        Кандидаты отбираются по n-граммному индексу, который строится
+        при первом поиске; запросы короче n-граммы проверяются перебором.
         """
-        books = self.get_all_books()
+        if self._pushdown:
+            return self.storage.search_books(value)
+
+        self._ensure_loaded()
         value = value.lower().strip()
+        if self._search_index is None:
+            self._search_index = NGramIndex()
+            self._search_index.build(self._books.values())
+
+        candidates = self._search_index.candidates(value)
+        if candidates is None:
+            return [
+                book
+                for book in self._books.values()
+                if self._text_matches(book, value) or value == str(book["year"])
+            ]
+
+        matches = {
+            book_id
+            for book_id in candidates
+            if self._text_matches(self._books[book_id], value)
+        }
+        matches |= self._search_index.year_matches(value)
         return [
-            book
-            for book in books
-            if value in book["title"].lower()
-            or value in book["author"].lower()
-            or value == str(book["year"])
+            self._books[book_id]
+            for book_id in self._search_index.in_catalog_order(matches)
         ]
 
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Возвращает книги каталога с позиции offset, не более limit штук.
+
+        Если актуальный каталог уже в памяти, страница берётся из него,
+        иначе читается из хранилища потоково без загрузки всего каталога.
+        """
+        if not self._pushdown and self._is_fresh():
+            stop = None if limit is None else offset + limit
+            return islice(self._books.values(), offset, stop)
+        return self.storage.iter_data(offset, limit)
+
+    def search_cursor(self, value: str) -> BookCursor:
+        """
+        Возвращает курсор по результатам поиска для постраничного просмотра.
+        """
+        if self._pushdown:
+            return BookCursor(self.storage.iter_search(value))
+        if self._is_fresh():
+            return BookCursor(iter(self.search_books_by_value(value)))
+
+        value = value.lower().strip()
+        return BookCursor(
+            book
+            for book in self.storage.iter_data()
+            if self._text_matches(book, value) or value == str(book["year"])
+        )
+
     def get_all_books(self) -> list[dict]:
         """
         Возвращает все книги из библиотеки.
         """
-        return self.storage.load_data()
+        if self._pushdown:
+            return self.storage.load_data()
+
+        self._ensure_loaded()
+        return list(self._books.values())
+
+    def _allocate_ids(self, count: int) -> int:
+        """
+        Выделяет count идущих подряд ID для новых книг и возвращает первый.
+        """
+        return max(self._books, default=0) + 1
+
+    @staticmethod
+    def _text_matches(book: dict, value: str) -> bool:
+        """
+        Проверяет, входит ли value в название или автора книги.
+        """
+        return value in book["title"].lower() or value in book["author"].lower()
 
-    def _generate_id(self) -> int:
+    def _is_fresh(self) -> bool:
         """
-        Генерирует уникальный ID для новой книги.
+        Проверяет, что каталог в памяти совпадает с хранилищем.
         """
-        books = self.get_all_books()
-        return max((book["id"] for book in books), default=0) + 1
+        return self._loaded and self.storage.get_signature() == self._signature
 
-    def _save_books_with_update(self, updated_book: dict) -> None:
+    def _ensure_loaded(self) -> None:
+        """
+        Загружает каталог в память, если он ещё не загружен
+        или файл данных изменился с момента последнего чтения.
+        Внутри batch() каталог не перечитывается.
         """
-        Сохраняет изменения книги в хранилище.
+        if self._pending_changes is not None:
+            return
+
+        signature = self.storage.get_signature()
+        if self._loaded and signature == self._signature:
+            return
+        self._books = {book["id"]: book for book in self.storage.load_data()}
+        self._search_index = None
+        self._signature = signature
+        self._loaded = True
+
+    def _commit(self, *changes: dict) -> None:
         """
-        books = self.get_all_books()
-        for i, book in enumerate(books):
-            if book["id"] == updated_book["id"]:
-                books[i] = updated_book
-                break
-        self.storage.save_data(books)
+        Записывает изменения каталога в хранилище (write-through).
+
+        Если хранилище умеет применять отдельные изменения (apply_changes),
+        передаются только они, иначе каталог сохраняется целиком.
+        Внутри batch() изменения накапливаются до выхода из блока.
+        """
+        if self._pending_changes is not None:
+            self._pending_changes.extend(changes)
+            return
+
+        apply_changes = getattr(self.storage, "apply_changes", None)
+        try:
+            if apply_changes is not None:
+                apply_changes(list(changes))
+            else:
+                self.storage.save_data(list(self._books.values()))
+        except Exception:
+            self._loaded = False
+            raise
+        self._signature = self.storage.get_signature()
@@ -0,0 +1,265 @@
+import sqlite3
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from storage import BaseStorage, Storage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    title_folded TEXT NOT NULL,
+    author_folded TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_books_title ON books (title_folded);
+CREATE INDEX IF NOT EXISTS idx_books_author ON books (author_folded);
+CREATE INDEX IF NOT EXISTS idx_books_year ON books (year);
+"""
+
+COLUMNS = "id, title, author, year, status"
+
+
+class SQLiteStorage(BaseStorage):
+    # LibraryManager выполняет запросы прямо в базе, не загружая каталог в память.
+    supports_queries = True
+
+    def __init__(self, db_file: str):
+        """
+        Хранилище каталога в базе SQLite.
+
+        Название и автор дополнительно хранятся в нижнем регистре
+        (sqlite lower() не работает с кириллицей), чтобы поиск совпадал
+        с поиском по JSON-каталогу.
+        """
+        self.db_file = db_file
+        self._in_transaction = False
+        try:
+            self._connection = sqlite3.connect(db_file)
+            self._connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Ошибка при открытии базы данных '{db_file}': {e}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Выполняет изменения в одной транзакции.
+
+        Вложенные вызовы входят во внешнюю транзакцию, которая фиксируется
+        при выходе из неё или откатывается при исключении.
+        """
+        if self._in_transaction:
+            yield self._connection
+            return
+
+        self._in_transaction = True
+        try:
+            with self._connection:
+                yield self._connection
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Ошибка при записи в базу данных '{self.db_file}': {e}"
+            )
+        finally:
+            self._in_transaction = False
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        self._connection.close()
+
+    def get_signature(self) -> Optional[tuple]:
+        """
+        Возвращает счётчик изменений базы данных.
+        """
+        total_changes = self._connection.total_changes
+        data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+        return total_changes, data_version
+
+    def load_data(self) -> list[Optional[dict]]:
+        """
+        Загружает все книги из базы данных.
+        """
+        rows = self._execute(f"SELECT {COLUMNS} FROM books ORDER BY id")
+        return [self._row_to_book(row) for row in rows]
+
+    def iter_data(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Возвращает страницу книг в порядке ID, читая строки курсором.
+        """
+        rows = self._execute(
+            f"SELECT {COLUMNS} FROM books ORDER BY id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        return map(self._row_to_book, rows)
+
+    def save_data(self, data: list[Optional[dict]]) -> None:
+        """
+        Заменяет содержимое базы данных переданными книгами.
+        """
+        with self.transaction():
+            self._connection.execute("DELETE FROM books")
+            self._insert_many(data)
+
+    def get_book(self, book_id: int) -> Optional[dict]:
+        """
+        Возвращает книгу по ID или None.
+        """
+        row = self._execute(
+            f"SELECT {COLUMNS} FROM books WHERE id = ?", (book_id,)
+        ).fetchone()
+        return self._row_to_book(row) if row else None
+
+    def insert_book(self, book: dict) -> int:
+        """
+        Добавляет книгу и возвращает присвоенный ей ID.
+        """
+        with self.transaction():
+            cursor = self._connection.execute(
+                "INSERT INTO books (title, author, year, status, "
+                "title_folded, author_folded) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    book["title"],
+                    book["author"],
+                    book["year"],
+                    book["status"],
+                    book["title"].lower(),
+                    book["author"].lower(),
+                ),
+            )
+        return cursor.lastrowid
+
+    def insert_books(self, books: list[dict]) -> None:
+        """
+        Добавляет книги одной транзакцией, ID присваивает база данных.
+        """
+        with self.transaction():
+            self._connection.executemany(
+                "INSERT INTO books (title, author, year, status, "
+                "title_folded, author_folded) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        book["title"],
+                        book["author"],
+                        book["year"],
+                        book["status"],
+                        book["title"].lower(),
+                        book["author"].lower(),
+                    )
+                    for book in books
+                ),
+            )
+
+    def delete_book(self, book_id: int) -> bool:
+        """
+        Удаляет книгу по ID. Возвращает False, если книги нет.
+        """
+        with self.transaction():
+            cursor = self._connection.execute(
+                "DELETE FROM books WHERE id = ?", (book_id,)
+            )
+        return cursor.rowcount > 0
+
+    def update_status(self, book_id: int, status: str) -> bool:
+        """
+        Изменяет статус книги. Возвращает False, если книги нет.
+        """
+        with self.transaction():
+            cursor = self._connection.execute(
+                "UPDATE books SET status = ? WHERE id = ?", (status, book_id)
+            )
+        return cursor.rowcount > 0
+
+    def search_books(self, value: str) -> list[dict]:
+        """
+        Ищет книги по подстроке в названии или авторе либо по году издания.
+        """
+        return list(self.iter_search(value))
+
+    def iter_search(self, value: str) -> Iterator[dict]:
+        """
+        Возвращает найденные книги по мере чтения строк курсором.
+        """
+        value = value.lower().strip()
+        condition = "instr(title_folded, ?) > 0 OR instr(author_folded, ?) > 0"
+        params: tuple = (value, value)
+        if value.isdigit() and str(int(value)) == value:
+            condition += " OR year = ?"
+            params += (int(value),)
+        rows = self._execute(
+            f"SELECT {COLUMNS} FROM books WHERE {condition} ORDER BY id", params
+        )
+        return map(self._row_to_book, rows)
+
+    def migrate_from_json(self, json_file: str) -> int:
+        """
+        Переносит книги из JSON-файла в пустую базу данных.
+        Возвращает количество перенесённых книг.
+        """
+        if self._execute("SELECT 1 FROM books LIMIT 1").fetchone():
+            raise RuntimeError(f"База данных '{self.db_file}' уже содержит книги.")
+        books = Storage(json_file).load_data()
+        with self.transaction():
+            self._insert_many(books)
+        return len(books)
+
+    def _insert_many(self, books: list[dict]) -> None:
+        """
+        Вставляет книги с сохранением их ID.
+        """
+        self._connection.executemany(
+            "INSERT INTO books (id, title, author, year, status, "
+            "title_folded, author_folded) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    book["id"],
+                    book["title"],
+                    book["author"],
+                    book["year"],
+                    book["status"],
+                    book["title"].lower(),
+                    book["author"].lower(),
+                )
+                for book in books
+            ),
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        Выполняет запрос на чтение.
+        """
+        try:
+            return self._connection.execute(sql, params)
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Ошибка при чтении базы данных '{self.db_file}': {e}"
+            )
+
+
+    @staticmethod
+    def _row_to_book(row: tuple) -> dict:
+        """
+        Преобразует строку таблицы в словарь книги.
+        """
+        book_id, title, author, year, status = row
+        return {
+            "id": book_id,
+            "title": title,
+            "author": author,
+            "year": year,
+            "status": status,
+        }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Использование: python src/sqlite_storage.py books.json books.db")
+        sys.exit(1)
+    storage = SQLiteStorage(sys.argv[2])
+    count = storage.migrate_from_json(sys.argv[1])
+    storage.close()
+    print(f"Перенесено книг: {count}")
@@ -1,39 +1,202 @@
 import json
 import os
-from typing import Optional
+import re
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Iterator, Optional
 
+READ_CHUNK_SIZE = 64 * 1024
+BOOKS_ARRAY_START = re.compile(r'"books"\s*:\s*\[')
 
-class Storage:
+
+class BaseStorage(ABC):
+    @abstractmethod
+    def load_data(self) -> list[Optional[dict]]:
+        """
+        Загружает все книги из хранилища.
+        """
+        pass
+
+    @abstractmethod
+    def save_data(self, data: list[Optional[dict]]) -> None:
+        """
+        Полностью перезаписывает хранилище переданными книгами.
+        """
+        pass
+
+    @abstractmethod
+    def get_signature(self) -> Optional[tuple]:
+        """
+        Возвращает отпечаток состояния хранилища, который меняется
+        при каждом изменении данных.
+        """
+        pass
+
+    @abstractmethod
+    def allocate_ids(self, count: int) -> int:
+        """
+        Выделяет count идущих подряд ID для новых книг и возвращает первый.
+        ID никогда не выдаются повторно, в том числе после удаления книг.
+        """
+        pass
+
+    def iter_data(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Возвращает книги с позиции offset, не более limit штук.
+        """
+        stop = None if limit is None else offset + limit
+        return islice(self.load_data(), offset, stop)
+
+
+class Storage(BaseStorage):
     def __init__(self, data_file: str):
         """
         Класс для работы с хранилищем данных.
+
+        Файл содержит заголовок со счётчиком ID и список книг:
+        {"next_id": 42, "books": [...]}. Файлы старого формата
+        (просто список книг) читаются как есть и переводятся
+        в новый формат при первой записи.
         """
         self.data_file = data_file
+        self._next_id: Optional[int] = None
+
+    def get_signature(self) -> Optional[tuple[int, int, int]]:
+        """
+        Возвращает отпечаток файла данных (mtime, размер, inode).
+        Если файла нет, возвращает None.
+        """
+        return self._file_signature(self.data_file)
 
     def load_data(self) -> list[Optional[dict]]:
         """
         Загружает данные из файла.
         """
-        if not os.path.exists(self.data_file):
-            return []
+        books, self._next_id = self._read_file(self.data_file)
+        return books
+
+    def allocate_ids(self, count: int) -> int:
+        """
+        Выделяет count идущих подряд ID и возвращает первый из них.
+
+        Счётчик хранится в заголовке файла и записывается вместе
+        с книгами при следующем сохранении.
+        """
+        first_id = self._current_next_id()
+        self._next_id = first_id + count
+        return first_id
+
+    def iter_data(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Читает книги из файла потоково, по одной записи.
+
+        Чтение останавливается после offset + limit книг, поэтому первая
+        страница каталога не требует разбора всего файла.
+        """
+        stop = None if limit is None else offset + limit
+        return islice(self._iter_file(self.data_file), offset, stop)
+
+    def save_data(self, data: list[Optional[dict]]) -> None:
+        """
+        Сохраняет данные в файл.
+        """
+        next_id = max(
+            self._current_next_id(),
+            max((book["id"] for book in data), default=0) + 1,
+        )
+        self._write_file(self.data_file, data, next_id)
+        self._next_id = next_id
+
+    def _iter_file(self, path: str) -> Iterator[dict]:
+        """
+        Разбирает JSON-массив книг из файла, читая его блоками.
+        """
+        if not os.path.exists(path):
+            return
+
+        decoder = json.JSONDecoder()
+        try:
+            with open(path, mode="r", encoding="UTF-8") as file:
+                buffer = file.read(READ_CHUNK_SIZE).lstrip()
+                if not buffer:
+                    return
+                if buffer.startswith("["):
+                    position = 1
+                else:
+                    books_start = BOOKS_ARRAY_START.search(buffer)
+                    if not buffer.startswith("{") or books_start is None:
+                        raise json.JSONDecodeError("Ожидался список книг", buffer, 0)
+                    position = books_start.end()
+                eof = False
+
+                while True:
+                    while position < len(buffer) and buffer[position] in " \t\r\n,":
+                        position += 1
+                    if position < len(buffer) and buffer[position] == "]":
+                        return
+                    try:
+                        book, position = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        chunk = file.read(READ_CHUNK_SIZE)
+                        eof = not chunk
+                        buffer = buffer[position:] + chunk
+                        position = 0
+                        continue
+                    yield book
+        except (IOError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Ошибка при загрузке данных из файла '{path}': {e}")
+
+    def _read_file(self, path: str) -> tuple[list[dict], int]:
+        """
+        Читает файл и возвращает список книг и следующий свободный ID.
+        """
+        if not os.path.exists(path):
+            return [], 1
 
         try:
-            with open(self.data_file, mode="r", encoding="UTF-8") as file:
+            with open(path, mode="r", encoding="UTF-8") as file:
                 data = json.load(file)
-                return data
         except (IOError, json.JSONDecodeError) as e:
-            raise RuntimeError(
-                f"Ошибка при загрузке данных из файла '{self.data_file}': {e}"
-            )
+            raise RuntimeError(f"Ошибка при загрузке данных из файла '{path}': {e}")
 
-    def save_data(self, data: list[Optional[dict]]) -> None:
+        # Файлы старого формата содержат только список книг.
+        if isinstance(data, list):
+            return data, max((book["id"] for book in data), default=0) + 1
+        return data["books"], data["next_id"]
+
+    def _write_file(self, path: str, data: list[Optional[dict]], next_id: int) -> None:
         """
-        Сохраняет данные в файл.
+        Записывает заголовок и книги в указанный файл.
+        Список книг записывается последним, чтобы его можно было читать потоково.
         """
         try:
-            with open(self.data_file, mode="w", encoding="UTF-8") as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            with open(path, mode="w", encoding="UTF-8") as file:
+                json.dump(
+                    {"next_id": next_id, "books": data},
+                    file,
+                    indent=4,
+                    ensure_ascii=False,
+                )
         except IOError as e:
-            raise RuntimeError(
-                f"Ошибка при сохранении данных в файл '{self.data_file}': {e}"
-            )
+            raise RuntimeError(f"Ошибка при сохранении данных в файл '{path}': {e}")
+
+    def _current_next_id(self) -> int:
+        """
+        Возвращает следующий свободный ID, при необходимости читая файл.
+        """
+        if self._next_id is None:
+            self.load_data()
+        return self._next_id
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[tuple[int, int, int]]:
+        """
+        Возвращает (mtime, размер, inode) файла или None, если файла нет.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
@@ -0,0 +1,51 @@
+import sys
+import unittest
+import os
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from bulk import export_books, import_books
+from library_manager import LibraryManager
+from storage import Storage
+
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.storage = Storage("test_books.json")
+        self.library_manager = LibraryManager(self.storage)
+
+    def tearDown(self):
+        for path in ("test_books.json", "test_import.csv", "test_export.jsonl"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_import_csv_and_export_jsonl(self):
+        """Тест импорта из CSV и экспорта в JSON Lines."""
+        self.library_manager.add_book("Existing", "Author", "2000")
+        with open("test_import.csv", mode="w", encoding="UTF-8") as file:
+            file.write("title,author,year\n")
+            for i in range(25):
+                file.write(f"Book {i},Author {i},{1900 + i}\n")
+
+        report = import_books(self.library_manager, "test_import.csv", batch_size=10)
+        self.assertEqual(report.count, 25)
+
+        export_books(LibraryManager(Storage("test_books.json")), "test_export.jsonl")
+        with open("test_export.jsonl", encoding="UTF-8") as file:
+            books = [json.loads(line) for line in file]
+        self.assertEqual([book["id"] for book in books], list(range(1, 27)))
+        self.assertEqual(books[-1]["year"], 1924)
+        self.assertEqual(books[-1]["status"], "в наличии")
+
+    def test_invalid_year_rejects_batch(self):
+        """Тест отклонения пачки с некорректным годом."""
+        records = [{"title": "Book", "author": "Author", "year": "2024"}] * 3
+        records.append({"title": "Book", "author": "Author", "year": "abc"})
+        with self.assertRaises(ValueError):
+            self.library_manager.add_books_bulk(records, batch_size=2)
+        self.assertEqual(len(self.library_manager.get_all_books()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import unittest
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from indexes import NGramIndex
+
+
+def brute_force_search(books: list[dict], value: str) -> list[int]:
+    return [
+        book["id"]
+        for book in books
+        if value in book["title"].lower()
+        or value in book["author"].lower()
+        or value == str(book["year"])
+    ]
+
+
+def indexed_search(index: NGramIndex, books: list[dict], value: str) -> list[int]:
+    by_id = {book["id"]: book for book in books}
+    candidates = index.candidates(value)
+    matches = {
+        book_id
+        for book_id in candidates
+        if value in by_id[book_id]["title"].lower()
+        or value in by_id[book_id]["author"].lower()
+    }
+    return index.in_catalog_order(matches | index.year_matches(value))
+
+
+class TestNGramIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        words = ["Война", "мир", "Мастер", "Маргарита", "Иден", "Толстой", "Лев"]
+        self.books = [
+            {
+                "id": book_id,
+                "title": " ".join(rng.sample(words, 2)),
+                "author": " ".join(rng.sample(words, 2)),
+                "year": rng.randint(1850, 1860),
+                "status": "в наличии",
+            }
+            for book_id in range(1, 201)
+        ]
+        self.index = NGramIndex()
+        self.index.build(self.books)
+
+    def test_matches_substring_search(self):
+        """Тест совпадения результатов индекса с поиском подстроки."""
+        for value in ("мар", "ргарита мир", "лев т", "1855", "xyz", "толстой лев"):
+            self.assertEqual(
+                indexed_search(self.index, self.books, value),
+                brute_force_search(self.books, value),
+            )
+
+    def test_remove_book(self):
+        """Тест удаления книги из индекса."""
+        removed = self.books.pop(10)
+        self.index.remove(removed)
+        for value in (removed["title"].lower(), str(removed["year"])):
+            self.assertNotIn(
+                removed["id"], indexed_search(self.index, self.books, value)
+            )
+            self.assertEqual(
+                indexed_search(self.index, self.books, value),
+                brute_force_search(self.books, value),
+            )
+
+    def test_short_query(self):
+        """Тест запроса короче n-граммы."""
+        self.assertIsNone(self.index.candidates("ми"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import unittest
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from journal_storage import JournalStorage
+from library_manager import LibraryManager
+from storage import Storage
+
+
+class TestJournalStorage(unittest.TestCase):
+    def setUp(self):
+        self.storage = JournalStorage("test_books.json")
+
+    def tearDown(self):
+        for path in ("test_books.json", "test_books.json.journal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_and_load_books(self):
+        """Тест сохранения и загрузки книг."""
+        books = [
+            {"id": 1, "title": "Book 1", "author": "Author", "status": "выдана"}
+        ]
+        self.storage.save_data(books)
+        self.assertEqual(self.storage.load_data(), books)
+
+    def test_replay_journal_on_load(self):
+        """Тест применения журнала поверх снимка при загрузке."""
+        library_manager = LibraryManager(self.storage)
+        library_manager.add_book("Book 1", "Author", "2024")
+        library_manager.add_book("Book 2", "Author", "2024")
+        library_manager.update_status_by_book_id(1, "выдана")
+        library_manager.delete_book_by_id(2)
+
+        self.assertFalse(os.path.exists("test_books.json"))
+        books = JournalStorage("test_books.json").load_data()
+        self.assertEqual(len(books), 1)
+        self.assertEqual(books[0]["status"], "выдана")
+
+    def test_iter_data_matches_load(self):
+        """Тест совпадения потокового чтения с полной загрузкой."""
+        library_manager = LibraryManager(self.storage)
+        for title in ("Book 1", "Book 2", "Book 3"):
+            library_manager.add_book(title, "Author", "2024")
+        self.storage.save_data(self.storage.load_data())
+        library_manager.add_book("Book 4", "Author", "2024")
+        library_manager.update_status_by_book_id(2, "выдана")
+        library_manager.delete_book_by_id(1)
+
+        self.assertEqual(list(self.storage.iter_data()), self.storage.load_data())
+        self.assertEqual(list(self.storage.iter_data(1, 2)), self.storage.load_data()[1:3])
+
+    def test_compaction(self):
+        """Тест сжатия журнала в новый снимок."""
+        storage = JournalStorage("test_books.json", compact_threshold=1)
+        library_manager = LibraryManager(storage)
+        library_manager.add_book("Book 1", "Author", "2024")
+        storage.wait_for_compaction()
+
+        self.assertEqual(os.path.getsize("test_books.json.journal"), 0)
+        self.assertEqual(len(Storage("test_books.json").load_data()), 1)
+        self.assertEqual(len(library_manager.get_all_books()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,6 +36,88 @@ class TestLibraryManager(unittest.TestCase):
         books = self.library_manager.get_all_books()
         self.assertEqual(books[0]["status"], "выдана")
 
+    def test_get_book_by_id_after_delete(self):
+        """Тест поиска книг по ID после удаления книги из середины каталога."""
+        for title in ("Book 1", "Book 2", "Book 3"):
+            self.library_manager.add_book(title, "Author", "2024")
+        self.library_manager.delete_book_by_id(2)
+        self.assertEqual(self.library_manager.get_book_by_id(3)["title"], "Book 3")
+        with self.assertRaises(KeyError):
+            self.library_manager.get_book_by_id(2)
+        ids = [book["id"] for book in self.library_manager.get_all_books()]
+        self.assertEqual(ids, [1, 3])
+
+    def test_search_after_add_and_delete(self):
+        """Тест поиска книг после добавления и удаления."""
+        self.library_manager.add_book("Мастер и Маргарита", "Булгаков", "1967")
+        self.assertEqual(len(self.library_manager.search_books_by_value("МАСТЕР")), 1)
+        self.library_manager.add_book("Мартин Иден", "Джек Лондон", "1909")
+        self.assertEqual(len(self.library_manager.search_books_by_value("мар")), 2)
+        self.library_manager.delete_book_by_id(1)
+        books = self.library_manager.search_books_by_value("мар")
+        self.assertEqual([book["id"] for book in books], [2])
+        self.assertEqual(len(self.library_manager.search_books_by_value("1909")), 1)
+
+    def test_iter_books_and_search_cursor(self):
+        """Тест постраничного чтения каталога и результатов поиска."""
+        for i in range(1, 13):
+            self.library_manager.add_book(f"Book {i}", "Author", "2024")
+        cold_manager = LibraryManager(Storage("test_books.json"))
+        page = list(cold_manager.iter_books(10, 5))
+        self.assertEqual([book["id"] for book in page], [11, 12])
+
+        cursor = self.library_manager.search_cursor("book 1")
+        self.assertEqual([book["id"] for book in cursor.fetch(0, 2)], [1, 10])
+        self.assertFalse(cursor.exhausted)
+        self.assertEqual([book["id"] for book in cursor.fetch(2, 5)], [11, 12])
+        self.assertTrue(cursor.exhausted)
+
+    def test_batch_saves_once(self):
+        """Тест сохранения всех изменений пакета одной записью."""
+        for title in ("Book 1", "Book 2", "Book 3"):
+            self.library_manager.add_book(title, "Author", "2024")
+        calls = []
+        save_data = self.storage.save_data
+        self.storage.save_data = lambda data: calls.append(1) or save_data(data)
+
+        with self.library_manager.batch():
+            self.library_manager.update_status_by_book_id(1, "выдана")
+            self.library_manager.update_status_by_book_id(2, "выдана")
+            self.library_manager.delete_book_by_id(3)
+
+        self.assertEqual(calls, [1])
+        books = Storage("test_books.json").load_data()
+        self.assertEqual([book["status"] for book in books], ["выдана", "выдана"])
+
+    def test_batch_rollback(self):
+        """Тест отката изменений пакета при исключении."""
+        self.library_manager.add_book("Book 1", "Author", "2024")
+        with self.assertRaises(KeyError):
+            with self.library_manager.batch():
+                self.library_manager.update_status_by_book_id(1, "выдана")
+                self.library_manager.delete_book_by_id(42)
+
+        book = self.library_manager.get_book_by_id(1)
+        self.assertEqual(book["status"], "в наличии")
+
+    def test_cached_catalog_not_reloaded(self):
+        """Тест повторного чтения каталога из памяти без разбора файла."""
+        self.library_manager.add_book("Test Book", "Author", "2024")
+        calls = []
+        load_data = self.storage.load_data
+        self.storage.load_data = lambda: calls.append(1) or load_data()
+        self.library_manager.get_book_by_id(1)
+        self.library_manager.search_books_by_value("test")
+        self.library_manager.update_status_by_book_id(1, "выдана")
+        self.assertEqual(calls, [])
+
+    def test_cache_reloaded_after_external_change(self):
+        """Тест перечитывания каталога после изменения файла извне."""
+        self.library_manager.add_book("Test Book", "Author", "2024")
+        other_manager = LibraryManager(Storage("test_books.json"))
+        other_manager.add_book("Other Book", "Author", "2023")
+        books = self.library_manager.get_all_books()
+        self.assertEqual(len(books), 2)
 
 if __name__ == "__main__":
     unittest.main()
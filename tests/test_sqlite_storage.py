@@ -0,0 +1,82 @@
+import sys
+import unittest
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from library_manager import LibraryManager
+from sqlite_storage import SQLiteStorage
+from storage import Storage
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.storage = SQLiteStorage("test_books.db")
+        self.library_manager = LibraryManager(self.storage)
+
+    def tearDown(self):
+        self.storage.close()
+        for path in ("test_books.db", "test_books.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_add_and_get_book(self):
+        """Тест добавления и получения книги по ID."""
+        self.library_manager.add_book("Test Book", "Author", "2024")
+        book = self.library_manager.get_book_by_id(1)
+        self.assertEqual(book["title"], "Test Book")
+        self.assertEqual(book["status"], "в наличии")
+
+    def test_search_books(self):
+        """Тест поиска без учёта регистра, в том числе по кириллице."""
+        self.library_manager.add_book("Мастер и Маргарита", "Михаил Булгаков", "1967")
+        self.library_manager.add_book("Мартин Иден", "Джек Лондон", "1909")
+        self.assertEqual(len(self.library_manager.search_books_by_value("МАР")), 2)
+        self.assertEqual(len(self.library_manager.search_books_by_value("булгаков")), 1)
+        self.assertEqual(len(self.library_manager.search_books_by_value("1909")), 1)
+
+    def test_delete_and_change_status(self):
+        """Тест удаления и изменения статуса книги."""
+        self.library_manager.add_book("Book 1", "Author", "2024")
+        self.library_manager.add_book("Book 2", "Author", "2024")
+        self.library_manager.update_status_by_book_id(2, "выдана")
+        self.library_manager.delete_book_by_id(1)
+        self.assertEqual(
+            self.library_manager.get_all_books(),
+            [
+                {
+                    "id": 2,
+                    "title": "Book 2",
+                    "author": "Author",
+                    "year": 2024,
+                    "status": "выдана",
+                }
+            ],
+        )
+        with self.assertRaises(KeyError):
+            self.library_manager.delete_book_by_id(1)
+
+    def test_batch_rollback(self):
+        """Тест отката транзакции пакета при исключении."""
+        self.library_manager.add_book("Book 1", "Author", "2024")
+        with self.assertRaises(KeyError):
+            with self.library_manager.batch():
+                self.library_manager.update_status_by_book_id(1, "выдана")
+                self.library_manager.delete_book_by_id(42)
+        self.assertEqual(self.library_manager.get_book_by_id(1)["status"], "в наличии")
+
+    def test_migrate_from_json(self):
+        """Тест переноса каталога из JSON-файла."""
+        books = [
+            {"id": 3, "title": "Book 3", "author": "Author", "year": 2001, "status": "выдана"},
+            {"id": 7, "title": "Book 7", "author": "Author", "year": 2002, "status": "в наличии"},
+        ]
+        Storage("test_books.json").save_data(books)
+        self.assertEqual(self.storage.migrate_from_json("test_books.json"), 2)
+        self.assertEqual(self.storage.load_data(), books)
+        self.library_manager.add_book("Book 8", "Author", "2024")
+        self.assertEqual(self.library_manager.get_book_by_id(8)["title"], "Book 8")
+
+
+if __name__ == "__main__":
+    unittest.main()
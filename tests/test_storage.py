@@ -24,6 +24,16 @@ class TestStorage(unittest.TestCase):
         loaded_books = self.storage.load_data()
         self.assertEqual(loaded_books, books)
 
+    def test_iter_books_page(self):
+        """Тест потокового чтения страницы книг."""
+        books = [
+            {"id": i, "title": f"Book {i}", "author": "Author", "status": "выдана"}
+            for i in range(1, 21)
+        ]
+        self.storage.save_data(books)
+        self.assertEqual(list(self.storage.iter_data(5, 5)), books[5:10])
+        self.assertEqual(list(self.storage.iter_data()), books)
+
     def test_load_books_empty_file(self):
         """Тест загрузки из пустого файла."""
         books = self.storage.load_data()